@@ -2,7 +2,7 @@
 constraint_library.py — reusable, named constraint groups for usersim dogfood.
 
 Constraint groups are plain functions that accept a FactNamespace (P) and return
-a list of named Z3 expressions. Personas import groups and compose them with
+a tuple of named Z3 expressions. Personas import groups and compose them with
 their own persona-specific constraints.
 
 Naming convention: "group/check-name"
@@ -19,238 +19,641 @@ Usage in a persona:
             *report_invariants(P),
             named("my-persona/custom-check", P.something >= 1),
         ]
+
+report_invariants and error_handling_invariants are concatenations of finer
+sub-groups (report_structural/size/coherence_invariants;
+exit_code/stderr/clean_message_invariants); compose just the part you need.
+
+Groups are memoized per FactNamespace; clear_constraint_cache() drops them.
+Every group accepts flat=True, which collapses its checks into one And(...)
+named after the group — one assertion, but violations only name the group and
+vacuity reporting is lost.  enable_prebuild_simplify() runs each check through
+Z3's simplifier when its group is built; reports then show Z3's normal form.
+
+check_names(group) lists a group's check labels without importing Z3;
+all_check_names() lists every label in the library.
 """
-from usersim.judgement.z3_compat import Implies, And, Not, named
+import contextvars
+import functools
+import inspect
+import weakref
+from sys import intern
+
+__all__ = (
+    "matrix_invariants",
+    "pipeline_invariants",
+    "timing_invariants",
+    "error_handling_invariants",
+    "exit_code_invariants",
+    "stderr_invariants",
+    "clean_message_invariants",
+    "report_invariants",
+    "report_structural_invariants",
+    "report_size_invariants",
+    "report_coherence_invariants",
+    "scaffold_invariants",
+    "judge_invariants",
+    "all_check_names",
+    "check_names",
+    "clear_constraint_cache",
+    "enable_prebuild_simplify",
+)
+
+
+def _call_key(fn, args, kwargs):
+    return (fn.__name__, args, tuple(sorted(kwargs.items())))
+
+
+# ── Combinators ───────────────────────────────────────────────────────────────
+#
+# Groups fetch Implies/And/Not/named through _ops() instead of importing them
+# at module level, so importing this file (or listing check names) never pulls
+# in Z3.
+#
+# "Not both a and b" checks are written in negation normal form — Or(¬a, ¬b)
+# with each negation folded into its comparison (total < 1, not
+# Not(total >= 1)) — which is what Z3's preprocessing would rewrite
+# Not(And(a, b)) into anyway.  That is one node fewer per check and one
+# rewrite Z3 can skip.
+
+_name_only = contextvars.ContextVar("constraint_library_name_only", default=False)
+
+
+class _Anything:
+    """Absorbs every fact, operator and combinator during name-only collection."""
+    def _absorb(self, *_):
+        return self
+    __add__ = __radd__ = __sub__ = __rsub__ = __mul__ = __rmul__ = _absorb
+    __eq__ = __ne__ = __lt__ = __le__ = __gt__ = __ge__ = _absorb
+    __hash__ = object.__hash__
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self
+
+
+_ANYTHING = _Anything()
+_LABEL_OPS = {
+    "Implies": lambda a, b: _ANYTHING,
+    "And":     lambda *args: _ANYTHING,
+    "Not":     lambda a: _ANYTHING,
+    "Or":      lambda *args: _ANYTHING,
+    "Guard":   lambda a, b: _ANYTHING,
+    "RealVal": lambda v: _ANYTHING,
+    "PbEq":    lambda args, k: _ANYTHING,
+    "PbGe":    lambda args, k: _ANYTHING,
+    "named":   lambda label, expr: label,
+}
+
+
+def _ops(*extra):
+    """Return (Implies, And, Not, named, *extra) — the combinators a group uses."""
+    if _name_only.get():
+        return tuple(_LABEL_OPS[n] for n in ("Implies", "And", "Not", "named", *extra))
+    return _z3_ops(extra)
+
+
+@functools.cache
+def _z3_ops(extra):
+    from usersim.judgement import z3_compat
+    return tuple(getattr(z3_compat, n) for n in ("Implies", "And", "Not", "named", *extra))
+
+
+@functools.lru_cache(maxsize=None)
+def check_names(group):
+    """Return the check labels a group produces, without building any Z3 terms."""
+    token = _name_only.set(True)
+    try:
+        return tuple(inspect.unwrap(group)(_ANYTHING))
+    finally:
+        _name_only.reset(token)
+
+
+# ── Prebuild simplification ──────────────────────────────────────────────────
+
+# Opt-in: push each group's checks through Z3's simplifier when they are built.
+_prebuild_simplify = False
+
+
+def enable_prebuild_simplify(enabled=True):
+    """Simplify each group's checks once, when the group is built.
+
+    Checks are simplified one at a time (an implication's antecedent and
+    consequent separately), so labels and vacuity tracking are preserved —
+    but reports then show Z3's normal form rather than the formula as
+    written here.  Off by default for that reason.  Drops memoized groups so
+    the setting applies to everything built after.
+    """
+    global _prebuild_simplify
+    _prebuild_simplify = enabled
+    clear_constraint_cache()
+
+
+def _simplified(expr):
+    """Return one check rewritten by simplify + propagate-values."""
+    from z3 import Goal, Then, is_implies
+    from usersim.judgement.z3_compat import Implies, Guard, named
+
+    tactic = Then("simplify", "propagate-values")
+
+    def simplify(formula):
+        goal = Goal()
+        goal.add(formula)
+        return tactic(goal)[0].as_expr()
+
+    if hasattr(expr, "_antecedent"):
+        antecedent, consequent = expr.arg(0), expr.arg(1)
+        rebuild = Implies
+        if not is_implies(expr):
+            # Guard: Or(Not(antecedent), consequent)
+            antecedent, rebuild = antecedent.arg(0), Guard
+        out = rebuild(simplify(antecedent), simplify(consequent))
+    else:
+        out = simplify(expr)
+    return named(expr._repr, out)
+
+
+def _simplifiable(fn):
+    """Apply _simplified to a group's checks while prebuild simplify is on."""
+    @functools.wraps(fn)
+    def wrapper(P, *args, **kwargs):
+        checks = fn(P, *args, **kwargs)
+        if not _prebuild_simplify:
+            return checks
+        from usersim.judgement.z3_compat import Z3_REAL
+        if not Z3_REAL:
+            return checks
+        return tuple(_simplified(e) for e in checks)
+    return wrapper
+
+
+# ── Flat mode ─────────────────────────────────────────────────────────────────
+
+def _flattenable(group):
+    """Add a flat=False keyword that collapses the group into one named And."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(P, *args, flat=False, **kwargs):
+            checks = fn(P, *args, **kwargs)
+            if flat:
+                from usersim.judgement.z3_compat import And, named
+                return (named(group, And(*checks)),)
+            return checks
+        return wrapper
+    return decorate
+
+
+# ── Memoization ───────────────────────────────────────────────────────────────
+
+# P → {(group, args): constraints}.  Weak keys so a cached group lives exactly
+# as long as its namespace — a recycled id(P) can never return stale facts.
+_cache = weakref.WeakKeyDictionary()
+
+
+def _memoize(fn):
+    """Cache a group's result per FactNamespace and extra arguments."""
+    @functools.wraps(fn)
+    def wrapper(P, *args, **kwargs):
+        per_ns = _cache.setdefault(P, {})
+        key = _call_key(fn, args, kwargs)
+        try:
+            return per_ns[key]
+        except KeyError:
+            result = per_ns[key] = fn(P, *args, **kwargs)
+            return result
+    return wrapper
+
+
+def clear_constraint_cache():
+    """Drop all memoized constraint groups."""
+    _cache.clear()
+
+
+def _compose(P, *groups):
+    """Concatenate several groups' checks, for groups made of sub-groups."""
+    if _name_only.get():
+        groups = [inspect.unwrap(g) for g in groups]
+    return tuple(check for group in groups for check in group(P))
+
+
+# ── Constants ─────────────────────────────────────────────────────────────────
+
+@functools.lru_cache(maxsize=32)
+def _const(RealVal, n):
+    """Return RealVal(n), built once per value.
+
+    Numeric facts are Real-sorted, so this is the same node Z3 would build
+    from the bare int on every use.  Only use it as a multiplication operand:
+    as the right-hand side of a comparison, Python would dispatch to the
+    constant's reflected operator and the formula would print back to front,
+    so comparison bounds stay bare literals.
+    """
+    return RealVal(n)
+
+
+# ── Flag tables ───────────────────────────────────────────────────────────────
+#
+# Most groups open with a run of "<success guard> implies <flag fact>" checks.
+# Those are declared here as (check, fact) rows and built by _flag_checks(),
+# so adding one is a one-line table edit.  Rows are emitted in table order at
+# the point the group splices them in; a flag check that sits elsewhere in a
+# group's output order is written out in the group instead.
+
+_FLAG_CHECKS = {
+    "pipeline": (
+        ("exit-0-implies-valid-json",          "output_is_valid_json"),
+        ("exit-0-implies-correct-schema",      "schema_is_correct"),
+    ),
+    "report": (
+        ("has-doctype",                        "report_has_doctype"),
+        ("is-self-contained",                  "report_is_self_contained"),
+        ("has-person-cards",                   "report_has_cards"),
+    ),
+    "scaffold": (
+        ("config-created",                     "config_created"),
+        ("instrumentation-created",            "instrumentation_created"),
+        ("perceptions-created",                "perceptions_created"),
+        ("user-file-created",                  "user_file_created"),
+        ("yaml-parseable",                     "yaml_parseable"),
+    ),
+    "judge": (
+        ("output-is-valid-json",               "judge_output_valid"),
+        ("schema-correct",                     "judge_schema_correct"),
+        ("has-results",                        "judge_has_results"),
+    ),
+}
+
+
+def _flag_checks(group, P, guard, implies, named):
+    """Build the group's table-driven checks: implies(guard, P.<fact>) each.
+
+    Labels are interned so, like the literal labels elsewhere, each is one
+    str object however often the group is built.
+    """
+    return tuple(named(intern(f"{group}/{check}"),
+                       implies(guard, getattr(P, fact)))
+                 for check, fact in _FLAG_CHECKS[group])
 
 
 # ── Matrix ────────────────────────────────────────────────────────────────────
 
+@_memoize
+@_flattenable("matrix")
+@_simplifiable
 def matrix_invariants(P):
     """Structural invariants for the person × path result matrix."""
-    return [
+    Implies, And, Not, named, Or = _ops("Or")
+    total     = P.results_total
+    satisfied = P.results_satisfied
+    persons   = P.person_count
+    paths     = P.scenario_count
+    matrix_size = persons * paths
+    has_results = total >= 1
+    return (
         named("matrix/total-equals-persons-times-paths",
-              Implies(P.results_total >= 1,
-                      P.results_total == P.person_count * P.scenario_count)),
+              Implies(has_results, total == matrix_size)),
         named("matrix/no-results-without-persons",
-              Not(And(P.results_total >= 1, P.person_count == 0))),
+              Or(total < 1, persons != 0)),
         named("matrix/no-results-without-paths",
-              Not(And(P.results_total >= 1, P.scenario_count == 0))),
+              Or(total < 1, paths != 0)),
         named("matrix/total-implies-at-least-one-person",
-              Implies(P.results_total >= 1, P.person_count >= 1)),
+              Implies(has_results, persons >= 1)),
         named("matrix/total-implies-at-least-one-path",
-              Implies(P.results_total >= 1, P.scenario_count >= 1)),
+              Implies(has_results, paths >= 1)),
         named("matrix/satisfied-never-exceeds-total",
-              Implies(P.results_total >= 1, P.results_satisfied <= P.results_total)),
+              Implies(has_results, satisfied <= total)),
         named("matrix/satisfied-consistent-with-dimensions",
-              Implies(And(P.results_total >= 1, P.results_satisfied >= 1),
-                      P.results_satisfied <= P.person_count * P.scenario_count)),
-    ]
+              Implies(And(has_results, satisfied >= 1),
+                      satisfied <= matrix_size)),
+    )
 
 
 # ── Pipeline ──────────────────────────────────────────────────────────────────
 
+@_memoize
+@_flattenable("pipeline")
+@_simplifiable
 def pipeline_invariants(P):
     """Structural invariants for the full pipeline run."""
-    return [
+    Implies, And, Not, named, Guard, Or = _ops("Guard", "Or")
+    exit_code           = P.pipeline_exit_code
+    valid_json          = P.output_is_valid_json
+    schema_ok           = P.schema_is_correct
+    total               = P.results_total
+    satisfied           = P.results_satisfied
+    succeeded = exit_code == 0
+    return (
         named("pipeline/exit-0-implies-results-exist",
-              Not(And(P.pipeline_exit_code == 0, P.results_total == 0))),
-        named("pipeline/exit-0-implies-valid-json",
-              Implies(P.pipeline_exit_code == 0, P.output_is_valid_json)),
-        named("pipeline/exit-0-implies-correct-schema",
-              Implies(P.pipeline_exit_code == 0, P.schema_is_correct)),
+              Or(exit_code != 0, total != 0)),
+        *_flag_checks("pipeline", P, succeeded, Implies, named),
         named("pipeline/valid-json-and-schema-implies-results",
-              Implies(And(P.output_is_valid_json, P.schema_is_correct),
-                      P.results_total >= 1)),
+              Guard(And(valid_json, schema_ok), total >= 1)),
         named("pipeline/valid-json-implies-satisfied-lte-total",
-              Implies(And(P.output_is_valid_json, P.results_total >= 1),
-                      P.results_satisfied <= P.results_total)),
+              Implies(And(valid_json, total >= 1), satisfied <= total)),
         named("pipeline/exit-0-implies-constraints-present",
-              Implies(P.pipeline_exit_code == 0, P.all_constraints_present)),
-    ]
+              Implies(succeeded, P.all_constraints_present)),
+    )
 
 
 # ── Timing ────────────────────────────────────────────────────────────────────
 
-def timing_invariants(P, max_ms_per_result=3000, max_total_ms=60000):
+# Default budgets; personas override them per call.
+_DEFAULT_MS_PER_RESULT = 3000
+_DEFAULT_TOTAL_MS      = 60000
+_FLOOR_MS_PER_PATH     = 10
+
+
+@_memoize
+@_flattenable("timing")
+@_simplifiable
+def timing_invariants(P, max_ms_per_result=_DEFAULT_MS_PER_RESULT,
+                      max_total_ms=_DEFAULT_TOTAL_MS):
     """Timing budget constraints: proportional to work, bounded above and below."""
-    return [
+    Implies, And, Not, named, RealVal = _ops("RealVal")
+    wall_ms = P.pipeline_wall_clock_ms
+    total   = P.results_total
+    persons = P.person_count
+    paths   = P.scenario_count
+    per_result = _const(RealVal, max_ms_per_result)
+    result_budget_ms = total * per_result
+    matrix_budget_ms = persons * paths * per_result
+    timed = wall_ms > 0
+    return (
         named("timing/budget-scales-with-result-count",
-              Implies(P.pipeline_wall_clock_ms > 0,
-                      P.pipeline_wall_clock_ms <= P.results_total * max_ms_per_result)),
+              Implies(timed, wall_ms <= result_budget_ms)),
         named("timing/budget-scales-with-matrix-dimensions",
-              Implies(P.pipeline_wall_clock_ms > 0,
-                      P.pipeline_wall_clock_ms
-                      <= P.person_count * P.scenario_count * max_ms_per_result)),
+              Implies(timed, wall_ms <= matrix_budget_ms)),
         named("timing/hard-ceiling",
-              Implies(P.pipeline_wall_clock_ms > 0,
-                      P.pipeline_wall_clock_ms <= max_total_ms)),
+              Implies(timed, wall_ms <= max_total_ms)),
         named("timing/floor-at-least-10ms-per-path",
-              Implies(P.pipeline_wall_clock_ms > 0,
-                      P.pipeline_wall_clock_ms >= P.scenario_count * 10)),
+              Implies(timed, wall_ms >= paths * _const(RealVal, _FLOOR_MS_PER_PATH))),
         named("timing/non-zero-when-results-exist",
-              Implies(P.results_total >= 1, P.pipeline_wall_clock_ms >= 1)),
-    ]
+              Implies(total >= 1, wall_ms >= 1)),
+    )
 
 
 # ── Error handling ────────────────────────────────────────────────────────────
+#
+# error_handling_invariants() is split by what each check looks at, so a
+# persona that only cares about exit codes can compose exit_code_invariants()
+# alone.
 
-def error_handling_invariants(P):
-    """All error modes must exit exactly 1, use stderr, and be clean."""
-    return [
-        # Exit codes
-        named("errors/missing-config-exits-1",
-              Implies(P.missing_config_exit_code >= 0, P.missing_config_exit_code == 1)),
-        named("errors/bad-yaml-exits-1",
-              Implies(P.bad_yaml_exit_code >= 0, P.bad_yaml_exit_code == 1)),
-        named("errors/missing-users-exits-1",
-              Implies(P.missing_users_exit_code >= 0, P.missing_users_exit_code == 1)),
+def _error_modes(P):
+    """(mode, exit code fact) for each error mode the CLI must handle."""
+    return (
+        ("missing-config", P.missing_config_exit_code),
+        ("bad-yaml",       P.bad_yaml_exit_code),
+        ("missing-users",  P.missing_users_exit_code),
+    )
+
+
+@_memoize
+@_flattenable("errors")
+@_simplifiable
+def exit_code_invariants(P):
+    """Every error mode must exit exactly 1."""
+    Implies, And, Not, named = _ops()
+    modes = _error_modes(P)
+    missing_config, bad_yaml, missing_users = (code for _, code in modes)
+    return (
+        *(named(intern(f"errors/{mode}-exits-1"), Implies(code >= 0, code == 1))
+          for mode, code in modes),
         # Sum invariant: all three exit codes must sum to exactly 3
         named("errors/all-three-exit-codes-sum-to-3",
-              Implies(
-                  And(P.missing_config_exit_code >= 0,
-                      P.bad_yaml_exit_code >= 0,
-                      P.missing_users_exit_code >= 0),
-                  P.missing_config_exit_code
-                  + P.bad_yaml_exit_code
-                  + P.missing_users_exit_code == 3)),
-        # Stderr routing — each mode independently and all together
-        named("errors/missing-config-uses-stderr",
-              Implies(P.missing_config_exit_code == 1, P.errors_use_stderr)),
-        named("errors/bad-yaml-uses-stderr",
-              Implies(P.bad_yaml_exit_code == 1, P.errors_use_stderr)),
-        named("errors/missing-users-uses-stderr",
-              Implies(P.missing_users_exit_code == 1, P.errors_use_stderr)),
+              Implies(And(*(code >= 0 for _, code in modes)),
+                      missing_config + bad_yaml + missing_users == 3)),
+    )
+
+
+@_memoize
+@_flattenable("errors")
+@_simplifiable
+def stderr_invariants(P):
+    """Every failing error mode must report on stderr."""
+    Implies, And, Not, named = _ops()
+    uses_stderr = P.errors_use_stderr
+    modes = _error_modes(P)
+    missing_config, bad_yaml, _ = (code for _, code in modes)
+    return (
+        # Each mode independently and all together
+        *(named(intern(f"errors/{mode}-uses-stderr"), Implies(code == 1, uses_stderr))
+          for mode, code in modes),
         named("errors/all-modes-agree-on-stderr",
-              Implies(And(P.missing_config_exit_code == 1, P.bad_yaml_exit_code == 1),
-                      P.errors_use_stderr)),
-        # Clean messages (no tracebacks)
-        named("errors/missing-config-clean-message",
-              Implies(P.missing_config_exit_code == 1, P.errors_are_clean)),
-        named("errors/bad-yaml-clean-message",
-              Implies(P.bad_yaml_exit_code == 1, P.errors_are_clean)),
-        named("errors/missing-users-clean-message",
-              Implies(P.missing_users_exit_code == 1, P.errors_are_clean)),
-        # Stdout must not be polluted
-        named("errors/missing-config-not-on-stdout",
-              Implies(P.missing_config_exit_code == 1, P.errors_not_on_stdout)),
-        named("errors/bad-yaml-not-on-stdout",
-              Implies(P.bad_yaml_exit_code == 1, P.errors_not_on_stdout)),
-    ]
+              Implies(And(missing_config == 1, bad_yaml == 1), uses_stderr)),
+    )
+
+
+@_memoize
+@_flattenable("errors")
+@_simplifiable
+def clean_message_invariants(P):
+    """Error messages carry no tracebacks and leave stdout alone."""
+    Implies, And, Not, named = _ops()
+    clean         = P.errors_are_clean
+    not_on_stdout = P.errors_not_on_stdout
+    modes = _error_modes(P)
+    return (
+        *(named(intern(f"errors/{mode}-clean-message"), Implies(code == 1, clean))
+          for mode, code in modes),
+        # Stdout must not be polluted (missing-config and bad-yaml only)
+        *(named(intern(f"errors/{mode}-not-on-stdout"), Implies(code == 1, not_on_stdout))
+          for mode, code in modes[:2]),
+    )
+
+
+@_memoize
+@_flattenable("errors")
+def error_handling_invariants(P):
+    """All error modes must exit exactly 1, use stderr, and be clean.
+
+    Equivalent to composing exit_code_invariants, stderr_invariants and
+    clean_message_invariants.
+    """
+    return _compose(P, exit_code_invariants, stderr_invariants,
+                    clean_message_invariants)
 
 
 # ── Report ────────────────────────────────────────────────────────────────────
+#
+# Likewise split: structure (is it a real HTML report), size (is it big enough
+# for what it claims to hold), and coherence with the pipeline run.
 
-def report_invariants(P):
-    """HTML report quality and size invariants."""
-    return [
-        # Structural presence
+@_memoize
+@_flattenable("report")
+@_simplifiable
+def report_structural_invariants(P):
+    """The report file exists and has the expected HTML structure."""
+    Implies, And, Not, named, Guard, PbGe = _ops("Guard", "PbGe")
+    exit_code      = P.report_exit_code
+    created        = P.report_file_created
+    doctype        = P.report_has_doctype
+    self_contained = P.report_is_self_contained
+    cards          = P.report_has_cards
+    return (
         named("report/created-when-exit-0",
-              Implies(P.report_exit_code == 0, P.report_file_created)),
-        named("report/has-doctype",
-              Implies(P.report_file_created, P.report_has_doctype)),
-        named("report/is-self-contained",
-              Implies(P.report_file_created, P.report_is_self_contained)),
-        named("report/has-person-cards",
-              Implies(P.report_file_created, P.report_has_cards)),
+              Implies(exit_code == 0, created)),
+        *_flag_checks("report", P, created, Guard, named),
         # Majority-vote quality: all 3 structural signals must hold
         named("report/all-quality-signals-present",
-              Implies(P.report_file_created,
-                      P.report_has_cards + P.report_is_self_contained
-                      + P.report_has_doctype >= 3)),
+              Guard(created, PbGe([(cards, 1), (self_contained, 1), (doctype, 1)], 3))),
+    )
+
+
+@_memoize
+@_flattenable("report")
+@_simplifiable
+def report_size_invariants(P):
+    """The report's size is in line with the results it renders."""
+    Implies, And, Not, named, Guard, RealVal, Or = _ops("Guard", "RealVal", "Or")
+    created        = P.report_file_created
+    doctype        = P.report_has_doctype
+    self_contained = P.report_is_self_contained
+    cards          = P.report_has_cards
+    size           = P.report_file_size_bytes
+    total          = P.results_total
+    persons        = P.person_count
+    return (
         # Not empty
         named("report/non-empty",
-              Not(And(P.report_file_created, P.report_file_size_bytes == 0))),
+              Or(Not(created), size != 0)),
         # Size scales with result count
         named("report/size-scales-with-total-results",
-              Implies(And(P.report_file_created, P.results_total >= 1),
-                      P.report_file_size_bytes >= P.results_total * 200)),
+              Implies(And(created, total >= 1),
+                      size >= total * _const(RealVal, 200))),
         # Size scales with both result count and persona count
         named("report/size-scales-with-matrix-dimensions",
-              Implies(And(P.report_file_created, P.results_total >= 1,
-                          P.person_count >= 1),
-                      P.report_file_size_bytes >= P.results_total * P.person_count * 50)),
+              Implies(And(created, total >= 1, persons >= 1),
+                      size >= total * persons * _const(RealVal, 50))),
         # Full quality → larger size floor
         named("report/full-quality-implies-larger-size",
-              Implies(And(P.report_has_doctype, P.report_is_self_contained,
-                          P.report_has_cards),
-                      P.report_file_size_bytes >= 8000)),
-        # Cross-system coherence: pipeline results → report must reflect them
+              Guard(And(doctype, self_contained, cards), size >= 8000)),
+    )
+
+
+@_memoize
+@_flattenable("report")
+@_simplifiable
+def report_coherence_invariants(P):
+    """A successful pipeline run is reflected in the report."""
+    Implies, And, Not, named, RealVal = _ops("RealVal")
+    created       = P.report_file_created
+    size          = P.report_file_size_bytes
+    pipeline_exit = P.pipeline_exit_code
+    total         = P.results_total
+    return (
         named("report/pipeline-results-reflected-in-size",
-              Implies(And(P.pipeline_exit_code == 0, P.report_file_created,
-                          P.results_total >= 1),
-                      P.report_file_size_bytes >= P.results_total * 200)),
-    ]
+              Implies(And(pipeline_exit == 0, created, total >= 1),
+                      size >= total * _const(RealVal, 200))),
+    )
+
+
+@_memoize
+@_flattenable("report")
+def report_invariants(P):
+    """HTML report quality and size invariants.
+
+    Equivalent to composing report_structural_invariants,
+    report_size_invariants and report_coherence_invariants; personas that
+    only care about one aspect should compose that sub-group directly.
+    """
+    return _compose(P, report_structural_invariants, report_size_invariants,
+                    report_coherence_invariants)
 
 
 # ── Scaffold ──────────────────────────────────────────────────────────────────
 
+@_memoize
+@_flattenable("scaffold")
+@_simplifiable
 def scaffold_invariants(P):
     """Init scaffold completeness and internal consistency."""
-    return [
+    Implies, And, Not, named, Guard, PbEq = _ops("Guard", "PbEq")
+    exit_code       = P.init_exit_code
+    config          = P.config_created
+    instrumentation = P.instrumentation_created
+    perceptions     = P.perceptions_created
+    user_file       = P.user_file_created
+    yaml_ok         = P.yaml_parseable
+    file_count      = P.scaffold_file_count
+    files_present   = config + instrumentation + perceptions + user_file
+    succeeded = exit_code == 0
+    return (
         # Exit code
         named("scaffold/exit-0",
-              Implies(P.init_exit_code >= 0, P.init_exit_code == 0)),
+              Implies(exit_code >= 0, succeeded)),
         # Individual files
-        named("scaffold/config-created",
-              Implies(P.init_exit_code == 0, P.config_created)),
-        named("scaffold/instrumentation-created",
-              Implies(P.init_exit_code == 0, P.instrumentation_created)),
-        named("scaffold/perceptions-created",
-              Implies(P.init_exit_code == 0, P.perceptions_created)),
-        named("scaffold/user-file-created",
-              Implies(P.init_exit_code == 0, P.user_file_created)),
-        named("scaffold/yaml-parseable",
-              Implies(P.init_exit_code == 0, P.yaml_parseable)),
+        *_flag_checks("scaffold", P, succeeded, Implies, named),
         # Logical dependency: can't parse a file that doesn't exist
         named("scaffold/yaml-parseable-implies-config-exists",
-              Implies(P.yaml_parseable, P.config_created)),
+              Guard(yaml_ok, config)),
         # Sum invariant: 4 boolean file flags must all be True
         named("scaffold/all-four-files-present-sum",
-              Implies(P.init_exit_code == 0,
-                      P.config_created + P.instrumentation_created
-                      + P.perceptions_created + P.user_file_created == 4)),
+              Implies(succeeded, PbEq([(config, 1), (instrumentation, 1),
+                                       (perceptions, 1), (user_file, 1)], 4))),
         # File count lower bound from individual flags
         named("scaffold/file-count-gte-sum-of-flags",
-              Implies(P.init_exit_code == 0,
-                      P.scaffold_file_count >= P.config_created
-                      + P.instrumentation_created + P.perceptions_created
-                      + P.user_file_created)),
+              Implies(succeeded, file_count >= files_present)),
         # Hard minimum
         named("scaffold/file-count-at-least-4",
-              Implies(P.init_exit_code == 0, P.scaffold_file_count >= 4)),
-    ]
+              Implies(succeeded, file_count >= 4)),
+    )
 
 
 # ── Judge ─────────────────────────────────────────────────────────────────────
 
+@_memoize
+@_flattenable("judge")
+@_simplifiable
 def judge_invariants(P):
     """Standalone judge subcommand structural invariants."""
-    return [
+    Implies, And, Not, named, Or = _ops("Or")
+    exit_code = P.judge_exit_code
+    total     = P.judge_total_count
+    satisfied = P.judge_satisfied_count
+    succeeded = exit_code == 0
+    has_total = total >= 1
+    return (
         # Can't succeed with nothing evaluated
         named("judge/no-empty-success",
-              Not(And(P.judge_exit_code == 0, P.judge_total_count == 0))),
+              Or(exit_code != 0, total != 0)),
         # Exact exit 0
         named("judge/exit-0",
-              Implies(P.judge_exit_code >= 0, P.judge_exit_code == 0)),
+              Implies(exit_code >= 0, succeeded)),
         # Output quality
-        named("judge/output-is-valid-json",
-              Implies(P.judge_exit_code == 0, P.judge_output_valid)),
-        named("judge/schema-correct",
-              Implies(P.judge_exit_code == 0, P.judge_schema_correct)),
-        named("judge/has-results",
-              Implies(P.judge_exit_code == 0, P.judge_has_results)),
+        *_flag_checks("judge", P, succeeded, Implies, named),
         # Count semantics
         named("judge/total-count-positive-on-success",
-              Implies(P.judge_exit_code == 0, P.judge_total_count >= 1)),
+              Implies(succeeded, has_total)),
         named("judge/satisfied-never-exceeds-total",
-              Implies(P.judge_total_count >= 1,
-                      P.judge_satisfied_count <= P.judge_total_count)),
+              Implies(has_total, satisfied <= total)),
         # At least one persona satisfied in a well-formed run
         named("judge/at-least-one-satisfied",
-              Implies(And(P.judge_exit_code == 0, P.judge_total_count >= 1),
-                      P.judge_satisfied_count >= 1)),
+              Implies(And(succeeded, has_total),
+                      satisfied >= 1)),
         # Pass rate: at least half must satisfy
         named("judge/at-least-50pct-satisfied",
-              Implies(And(P.judge_exit_code == 0, P.judge_total_count >= 1),
-                      P.judge_satisfied_count * 2 >= P.judge_total_count)),
-    ]
+              Implies(And(succeeded, has_total),
+                      satisfied * 2 >= total)),
+    )
+
+
+# ── Catalogue ─────────────────────────────────────────────────────────────────
+
+# Top-level groups only; the report/error sub-groups are covered by these.
+_GROUPS = (
+    matrix_invariants,
+    pipeline_invariants,
+    timing_invariants,
+    error_handling_invariants,
+    report_invariants,
+    scaffold_invariants,
+    judge_invariants,
+)
+
+
+@functools.cache
+def all_check_names():
+    """Return every check label the library can produce, interned, in group order."""
+    return tuple(intern(name) for group in _GROUPS for name in check_names(group))
+
@@ -7,113 +7,222 @@ timing, error handling, and report quality.
 
 USERSIM_PATH controls which measurement function runs.
 """
+import contextlib
 import json
 import os
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# orjson is optional — it parses the pipeline's --out files noticeably faster
+# than the stdlib, but the stdlib is all the harness needs.
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumpb = orjson.dumps
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+
+    def _dumpb(obj):
+        return json.dumps(obj).encode()
+
 SCENARIO = os.environ.get("USERSIM_PATH", "data_processor_example")
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DP_DIR = str(PROJECT_ROOT / "examples" / "data-processor")
+DP_CONFIG = os.path.join(DP_DIR, "usersim.yaml")
+# Resolved to an absolute path once, here.  Not `python -m usersim`: that puts
+# the working directory on sys.path, and the examples keep their simulation
+# files in a usersim/ directory that would shadow the package.
 USERSIM = shutil.which("usersim") or "usersim"
 
 
 # ── Helpers ──────────────────────────────────────────────────────────────────
 
+# Every fd Python opens is non-inheritable (PEP 446) — including the pipes of
+# scenarios running concurrently and mkstemp's O_CLOEXEC temp files — so on
+# Linux children can skip the close-everything sweep before exec.
+_CLOSE_FDS = not sys.platform.startswith("linux")
+
+
 def _run(args, *, stdin_data=None, cwd=None, timeout=120):
-    """Run a subprocess and return the CompletedProcess."""
+    """
+    Run a subprocess and return the CompletedProcess.
+
+    stdout and stderr are left as bytes: the scenarios only parse them as
+    JSON, strip them, or search them for a marker, and none of that needs
+    a decoded str.  stdin_data, if given, must be bytes too.
+
+    Scenarios always launch the real usersim executable.  Exit codes, stderr
+    routing and startup cost are part of what is being measured, so there
+    is deliberately no in-process or long-lived-daemon shortcut here.
+    """
     return subprocess.run(
         args,
         input=stdin_data,
         capture_output=True,
-        text=True,
+        close_fds=_CLOSE_FDS,
         cwd=cwd or str(PROJECT_ROOT),
         timeout=timeout,
     )
 
 
-def _is_valid_json(text):
-    """Try to parse text as JSON, return (parsed, True) or (None, False)."""
+def _is_valid_json(data):
+    """Try to parse str or bytes as JSON, return (parsed, True) or (None, False)."""
     try:
-        return json.loads(text), True
-    except (json.JSONDecodeError, TypeError):
+        return _loads(data), True
+    except (ValueError, TypeError):
         return None, False
 
 
-def _looks_like_traceback(text):
-    """Return True if text looks like a raw Python traceback."""
-    return "Traceback (most recent call last)" in text
+@contextlib.contextmanager
+def _scenario_dir(tmp, name, prefix):
+    """
+    Yield a fresh directory for one scenario's files.
+
+    With tmp (a directory shared by a full_integration pass) that is a new
+    tmp/name, cleaned up with tmp itself; otherwise a TemporaryDirectory of
+    the scenario's own.
+    """
+    if tmp is None:
+        with tempfile.TemporaryDirectory(prefix=prefix) as own:
+            yield own
+    else:
+        path = os.path.join(tmp, name)
+        os.mkdir(path)
+        yield path
+
+
+def _count_files(root):
+    """Count regular files under root, recursively, without building Paths."""
+    count = 0
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    count += 1
+    return count
+
+
+_TRACEBACK = b"Traceback (most recent call last)"
+
+
+def _any_traceback(*outputs):
+    """Return True if any of the outputs looks like a raw Python traceback."""
+    return any(_TRACEBACK in output for output in outputs)
 
 
 # ── Scenario: data_processor_example ─────────────────────────────────────────
 
-def measure_data_processor_example():
-    """Run the full pipeline on examples/data-processor and measure everything."""
-    dp_dir = PROJECT_ROOT / "examples" / "data-processor"
-    out_file = tempfile.NamedTemporaryFile(suffix=".json", delete=False)
-    out_file.close()
+# full_integration runs this scenario and violation_health concurrently; both
+# read the same pipeline run, so it happens once and the second caller waits.
+_dp_lock = threading.Lock()
+_dp_run = None
 
-    try:
-        t0 = time.perf_counter()
-        result = _run(
-            [USERSIM, "run",
-             "--config", str(dp_dir / "usersim.yaml"),
-             "--out", out_file.name],
-            cwd=str(dp_dir),
-        )
-        wall_clock_ms = (time.perf_counter() - t0) * 1000
 
-        parsed, valid_json = _is_valid_json(result.stdout)
+def _run_data_processor():
+    """
+    Run the pipeline on examples/data-processor once per process.
+
+    Returns (CompletedProcess, parsed --out file or None, wall_clock_ms).
+    """
+    global _dp_run
+    with _dp_lock:
+        if _dp_run is not None:
+            return _dp_run
+
+        fd, out_path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
 
-        # Parse the output file too (--out writes there)
-        file_parsed = None
         try:
-            with open(out_file.name) as f:
-                file_parsed = json.load(f)
-        except Exception:
-            pass
-
-        # Use whichever source has results
-        data = file_parsed or parsed or {}
-        results = data.get("results", [])
-        summary = data.get("summary", {})
-
-        persons = set()
-        paths = set()
-        all_have_constraints = True
-        for r in results:
-            persons.add(r.get("person", ""))
-            paths.add(r.get("path", ""))
-            if "constraints" not in r:
-                all_have_constraints = False
+            t0 = time.perf_counter()
+            result = _run(
+                [USERSIM, "run",
+                 "--config", DP_CONFIG,
+                 "--out", out_path],
+                cwd=DP_DIR,
+            )
+            wall_clock_ms = (time.perf_counter() - t0) * 1000
 
-        return {
-            "exit_code": result.returncode,
-            "wall_clock_ms": round(wall_clock_ms, 1),
-            "stdout_valid_json": valid_json or file_parsed is not None,
-            "results_schema_valid": data.get("schema", "") in (
-                "usersim.results.v1", "usersim.matrix.v1"
-            ),
-            "results_total": summary.get("total", 0),
-            "results_satisfied": summary.get("satisfied", 0),
-            "results_score": summary.get("score", 0.0),
-            "person_count": len(persons),
-            "scenario_count": len(paths),
-            "all_constraints_present": all_have_constraints and len(results) > 0,
-            "stderr_output": len(result.stderr.strip()) > 0,
-        }
-    finally:
-        os.unlink(out_file.name)
+            # Parse the output file too (--out writes there)
+            file_parsed = None
+            try:
+                with open(out_path, "rb") as f:
+                    file_parsed = _loads(f.read())
+            except Exception:
+                pass
+        finally:
+            try:
+                os.unlink(out_path)
+            except OSError:
+                pass
+
+        _dp_run = (result, file_parsed, wall_clock_ms)
+        return _dp_run
+
+
+def _reset_data_processor_run():
+    """Forget the shared pipeline run so the next caller starts a fresh one."""
+    global _dp_run
+    with _dp_lock:
+        _dp_run = None
+
+
+def measure_data_processor_example():
+    """Run the full pipeline on examples/data-processor and measure everything."""
+    result, file_parsed, wall_clock_ms = _run_data_processor()
+
+    parsed, valid_json = _is_valid_json(result.stdout)
+
+    # Use whichever source has results
+    data = file_parsed or parsed or {}
+    results = data.get("results", [])
+    summary = data.get("summary", {})
+
+    persons = set()
+    paths = set()
+    add_person, add_path = persons.add, paths.add
+    all_have_constraints = True
+    for r in results:
+        get = r.get
+        add_person(get("person", ""))
+        add_path(get("path", ""))
+        if all_have_constraints and "constraints" not in r:
+            all_have_constraints = False
+
+    return {
+        "exit_code": result.returncode,
+        "wall_clock_ms": round(wall_clock_ms, 1),
+        "stdout_valid_json": valid_json or file_parsed is not None,
+        "results_schema_valid": data.get("schema", "") in (
+            "usersim.results.v1", "usersim.matrix.v1"
+        ),
+        "results_total": summary.get("total", 0),
+        "results_satisfied": summary.get("satisfied", 0),
+        "results_score": summary.get("score", 0.0),
+        "person_count": len(persons),
+        "scenario_count": len(paths),
+        "all_constraints_present": all_have_constraints and len(results) > 0,
+        "stderr_output": len(result.stderr.strip()) > 0,
+    }
 
 
 # ── Scenario: scaffold_and_validate ──────────────────────────────────────────
 
-def measure_scaffold_and_validate():
+def measure_scaffold_and_validate(tmp=None):
     """Run usersim init in a temp dir and verify the scaffolded structure."""
-    with tempfile.TemporaryDirectory(prefix="usersim_dogfood_") as tmp:
+    with _scenario_dir(tmp, "scaffold", "usersim_dogfood_") as tmp:
         result = _run([USERSIM, "init", tmp])
 
         tmp_path = Path(tmp)
@@ -126,14 +235,15 @@ def measure_scaffold_and_validate():
         if config_path.exists():
             try:
                 import yaml
+                # libyaml's loader when PyYAML was built with it
+                loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
                 with open(config_path) as f:
-                    yaml.safe_load(f)
+                    yaml.load(f, Loader=loader)
                 yaml_parseable = True
             except Exception:
                 pass
 
-        all_files = list(tmp_path.rglob("*"))
-        file_count = sum(1 for f in all_files if f.is_file())
+        file_count = _count_files(tmp)
 
         return {
             "init_exit_code": result.returncode,
@@ -148,22 +258,14 @@ def measure_scaffold_and_validate():
 
 # ── Scenario: bad_config ────────────────────────────────────────────────────
 
-def measure_bad_config():
+def measure_bad_config(tmp=None):
     """Run usersim with intentionally broken inputs and verify graceful errors."""
-    with tempfile.TemporaryDirectory(prefix="usersim_dogfood_bad_") as tmp:
-        # 1. Missing config file
-        r_missing = _run(
-            [USERSIM, "run", "--config", "/nonexistent/usersim.yaml"],
-        )
-
-        # 2. Bad YAML content
+    with _scenario_dir(tmp, "bad_config", "usersim_dogfood_bad_") as tmp:
+        # Bad YAML content
         bad_yaml_path = Path(tmp) / "bad.yaml"
         bad_yaml_path.write_text(":::not valid yaml{{{\n")
-        r_bad_yaml = _run(
-            [USERSIM, "run", "--config", str(bad_yaml_path)],
-        )
 
-        # 3. Valid YAML but users glob matches nothing
+        # Valid YAML but users glob matches nothing
         empty_users_path = Path(tmp) / "empty_users.yaml"
         empty_users_path.write_text(
             'version: 1\n'
@@ -174,29 +276,34 @@ def measure_bad_config():
             'paths:\n'
             '  - default\n'
         )
-        r_no_users = _run(
-            [USERSIM, "run", "--config", str(empty_users_path)],
-        )
 
-        # Check error quality
-        all_stderr = r_missing.stderr + r_bad_yaml.stderr + r_no_users.stderr
-        all_stdout = r_missing.stdout + r_bad_yaml.stdout + r_no_users.stdout
+        # The three runs are independent — launch them together
+        configs = ("/nonexistent/usersim.yaml", bad_yaml_path, empty_users_path)
+        with ThreadPoolExecutor(max_workers=len(configs)) as pool:
+            r_missing, r_bad_yaml, r_no_users = pool.map(
+                lambda config: _run([USERSIM, "run", "--config", str(config)]),
+                configs,
+            )
+
+        # Check error quality — each run's output on its own, no concatenation
+        runs = (r_missing, r_bad_yaml, r_no_users)
+        stderrs = [r.stderr for r in runs]
 
         return {
             "missing_config_exit_code": r_missing.returncode,
             "bad_yaml_exit_code": r_bad_yaml.returncode,
             "missing_users_exit_code": r_no_users.returncode,
-            "error_has_stderr": len(all_stderr.strip()) > 0,
-            "error_not_traceback": not _looks_like_traceback(all_stderr),
-            "error_not_on_stdout": not _looks_like_traceback(all_stdout),
+            "error_has_stderr": any(err.strip() for err in stderrs),
+            "error_not_traceback": not _any_traceback(*stderrs),
+            "error_not_on_stdout": not _any_traceback(*(r.stdout for r in runs)),
         }
 
 
 # ── Scenario: judge_standalone ───────────────────────────────────────────────
 
-def measure_judge_standalone():
+def measure_judge_standalone(tmp=None):
     """Run usersim judge directly with synthetic perceptions and a minimal user file."""
-    with tempfile.TemporaryDirectory(prefix="usersim_dogfood_judge_") as tmp:
+    with _scenario_dir(tmp, "judge", "usersim_dogfood_judge_") as tmp:
         tmp_path = Path(tmp)
 
         # Create a synthetic perceptions JSON
@@ -210,7 +317,7 @@ def measure_judge_standalone():
             },
         }
         perc_path = tmp_path / "perceptions.json"
-        perc_path.write_text(json.dumps(perc))
+        perc_path.write_text(_dumps(perc))
 
         # Create a minimal user file
         user_code = (
@@ -249,9 +356,40 @@ def measure_judge_standalone():
 
 # ── Scenario: report_generation ──────────────────────────────────────────────
 
-def measure_report_generation():
+_CARD_MARKERS = (b'class="card ', b'class="card"')
+_EXTERNAL_ASSETS = (b'<link rel="stylesheet"', b'<script src=')
+_MARKER_OVERLAP = max(map(len, _CARD_MARKERS + _EXTERNAL_ASSETS)) - 1
+
+
+def _scan_report(path, chunk_size=1 << 16):
+    """
+    Check an HTML report in one streaming pass.
+
+    Returns (size_bytes, has_doctype, has_cards, has_external_assets).  Each
+    chunk is searched together with the tail of the previous one so markers
+    that straddle a chunk boundary are still found, and reading stops as
+    soon as both marker kinds have been seen.
+    """
+    size = os.stat(path).st_size
+    has_cards = external = False
+    with open(path, "rb") as f:
+        buf = f.read(max(chunk_size, 1024))  # doctype check needs the whole head
+        has_doctype = buf.lstrip().startswith((b"<!DOCTYPE", b"<!doctype"))
+        while buf:
+            has_cards = has_cards or any(m in buf for m in _CARD_MARKERS)
+            external = external or any(m in buf for m in _EXTERNAL_ASSETS)
+            if has_cards and external:
+                break
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            buf = buf[-_MARKER_OVERLAP:] + chunk
+    return size, has_doctype, has_cards, external
+
+
+def measure_report_generation(tmp=None):
     """Generate an HTML report from known results and verify it's valid."""
-    with tempfile.TemporaryDirectory(prefix="usersim_dogfood_report_") as tmp:
+    with _scenario_dir(tmp, "report", "usersim_dogfood_report_") as tmp:
         tmp_path = Path(tmp)
 
         # Create a known-good results JSON (matrix format — each result has "path")
@@ -289,7 +427,7 @@ def measure_report_generation():
             "summary": {"total": 2, "satisfied": 1, "score": 0.5},
         }
         results_path = tmp_path / "results.json"
-        results_path.write_text(json.dumps(results_data))
+        results_path.write_text(_dumps(results_data))
 
         report_path = tmp_path / "report.html"
         result = _run([
@@ -298,25 +436,72 @@ def measure_report_generation():
             "--out", str(report_path),
         ])
 
-        html = ""
-        if report_path.exists():
-            html = report_path.read_text()
+        created = report_path.exists()
+        size, has_doctype, has_cards, external = (
+            _scan_report(report_path) if created else (0, False, False, False)
+        )
 
         return {
             "report_exit_code": result.returncode,
-            "report_file_created": report_path.exists(),
-            "report_file_size_bytes": len(html),
-            "report_has_doctype": html.lstrip().startswith("<!DOCTYPE") or html.lstrip().startswith("<!doctype"),
-            "report_has_cards": 'class="card ' in html or 'class="card"' in html,
-            "report_is_self_contained": (
-                '<link rel="stylesheet"' not in html
-                and '<script src=' not in html
-            ) if html else False,
+            "report_file_created": created,
+            "report_file_size_bytes": size,
+            "report_has_doctype": has_doctype,
+            "report_has_cards": has_cards,
+            "report_is_self_contained": not external if size else False,
         }
 
 
 # ── Scenario: full_integration ───────────────────────────────────────────────
 
+# What full_integration takes from each scenario (DISPATCH name → metric keys).
+SCENARIO_METRICS = {
+    "data_processor_example": (
+        "exit_code", "wall_clock_ms", "stdout_valid_json",
+        "results_schema_valid", "results_total", "results_satisfied",
+        "results_score", "person_count", "scenario_count",
+        "all_constraints_present", "stderr_output",
+    ),
+    "scaffold_and_validate": (
+        "init_exit_code", "config_created", "instrumentation_created",
+        "perceptions_created", "user_file_created", "yaml_parseable",
+        "scaffold_file_count",
+    ),
+    "bad_config": (
+        "missing_config_exit_code", "bad_yaml_exit_code",
+        "missing_users_exit_code", "error_has_stderr",
+        "error_not_traceback", "error_not_on_stdout",
+    ),
+    "judge_standalone": (
+        "judge_exit_code", "judge_output_valid_json", "judge_has_results",
+        "judge_schema_correct", "judge_satisfied_count", "judge_total_count",
+    ),
+    "report_generation": (
+        "report_exit_code", "report_file_created", "report_file_size_bytes",
+        "report_has_doctype", "report_has_cards", "report_is_self_contained",
+    ),
+    "violation_health": (
+        "vh_total_constraint_evals", "vh_total_violations",
+        "vh_unique_constraints", "vh_violated_constraints",
+        "vh_antecedent_fired_count",
+    ),
+    "broken_example": (
+        "broken_instr_exit_code", "broken_ran_to_completion",
+        "broken_failure_detected",
+    ),
+}
+
+
+# Scenarios that accept tmp= — full_integration gives them subdirectories of
+# one shared temp dir instead of each creating and removing its own.
+_SHARES_TMP = {
+    "scaffold_and_validate",
+    "bad_config",
+    "judge_standalone",
+    "report_generation",
+    "broken_example",
+}
+
+
 def measure_full_integration():
     """
     Run all subsystems in a single pass and return a complete metric set.
@@ -325,79 +510,28 @@ def measure_full_integration():
     to evaluate against — no vacuous antecedents from missing metrics.
 
     It combines: pipeline run + init scaffold + error handling +
-                 judge standalone + report generation.
+                 judge standalone + report generation +
+                 violation health + broken example.
+
+    The data-processor pipeline runs first, on its own, because its
+    wall_clock_ms feeds the timing budgets and must not be measured under
+    contention.  The remaining scenarios are untimed and independent, so
+    they then run concurrently; data_processor_example and violation_health
+    reuse the pipeline run that was just measured.
     """
-    metrics = {}
-
-    # 1. Pipeline (data-processor example) ─────────────────────────────────
-    dp_metrics = measure_data_processor_example()
-    metrics.update({
-        "exit_code":              dp_metrics["exit_code"],
-        "wall_clock_ms":         dp_metrics["wall_clock_ms"],
-        "stdout_valid_json":     dp_metrics["stdout_valid_json"],
-        "results_schema_valid":  dp_metrics["results_schema_valid"],
-        "results_total":         dp_metrics["results_total"],
-        "results_satisfied":     dp_metrics["results_satisfied"],
-        "results_score":         dp_metrics["results_score"],
-        "person_count":          dp_metrics["person_count"],
-        "scenario_count":        dp_metrics["scenario_count"],
-        "all_constraints_present": dp_metrics["all_constraints_present"],
-        "stderr_output":         dp_metrics["stderr_output"],
-    })
-
-    # 2. Scaffold (init) ────────────────────────────────────────────────────
-    init_metrics = measure_scaffold_and_validate()
-    metrics.update({
-        "init_exit_code":        init_metrics["init_exit_code"],
-        "config_created":        init_metrics["config_created"],
-        "instrumentation_created": init_metrics["instrumentation_created"],
-        "perceptions_created":   init_metrics["perceptions_created"],
-        "user_file_created":     init_metrics["user_file_created"],
-        "yaml_parseable":        init_metrics["yaml_parseable"],
-        "scaffold_file_count":   init_metrics["scaffold_file_count"],
-    })
-
-    # 3. Error handling ─────────────────────────────────────────────────────
-    bad_metrics = measure_bad_config()
-    metrics.update({
-        "missing_config_exit_code": bad_metrics["missing_config_exit_code"],
-        "bad_yaml_exit_code":       bad_metrics["bad_yaml_exit_code"],
-        "missing_users_exit_code":  bad_metrics["missing_users_exit_code"],
-        "error_has_stderr":         bad_metrics["error_has_stderr"],
-        "error_not_traceback":      bad_metrics["error_not_traceback"],
-        "error_not_on_stdout":      bad_metrics["error_not_on_stdout"],
-    })
-
-    # 4. Judge standalone ───────────────────────────────────────────────────
-    judge_metrics = measure_judge_standalone()
-    metrics.update({
-        "judge_exit_code":          judge_metrics["judge_exit_code"],
-        "judge_output_valid_json":  judge_metrics["judge_output_valid_json"],
-        "judge_has_results":        judge_metrics["judge_has_results"],
-        "judge_schema_correct":     judge_metrics["judge_schema_correct"],
-        "judge_satisfied_count":    judge_metrics["judge_satisfied_count"],
-        "judge_total_count":        judge_metrics["judge_total_count"],
-    })
-
-    # 5. Report generation ──────────────────────────────────────────────────
-    report_metrics = measure_report_generation()
-    metrics.update({
-        "report_exit_code":         report_metrics["report_exit_code"],
-        "report_file_created":      report_metrics["report_file_created"],
-        "report_file_size_bytes":   report_metrics["report_file_size_bytes"],
-        "report_has_doctype":       report_metrics["report_has_doctype"],
-        "report_has_cards":         report_metrics["report_has_cards"],
-        "report_is_self_contained": report_metrics["report_is_self_contained"],
-    })
-
-    # 6. Violation health ───────────────────────────────────────────────────
-    vh_metrics = measure_violation_health()
-    metrics.update(vh_metrics)
-
-    # 7. Broken example ─────────────────────────────────────────────────────
-    broken_metrics = measure_broken_example()
-    metrics.update(broken_metrics)
+    _reset_data_processor_run()
+    _run_data_processor()
+    with tempfile.TemporaryDirectory(prefix="usersim_dogfood_") as tmp, \
+            ThreadPoolExecutor(max_workers=len(SCENARIO_METRICS)) as pool:
+        futures = {}
+        for name in SCENARIO_METRICS:
+            kwargs = {"tmp": tmp} if name in _SHARES_TMP else {}
+            futures[name] = pool.submit(DISPATCH[name], **kwargs)
 
+    metrics = {}
+    for name in SCENARIO_METRICS:
+        produced = futures[name].result()
+        metrics.update((key, produced[key]) for key in SCENARIO_METRICS[name])
     return metrics
 
 
@@ -410,67 +544,53 @@ def measure_violation_health():
     A useful constraint system should have *some* violations — constraints that
     never fire across all runs are either too loose or testing the wrong thing.
     This path measures the violation rate of usersim against itself.
-    """
-    dp_dir = PROJECT_ROOT / "examples" / "data-processor"
-    out_file = tempfile.NamedTemporaryFile(suffix=".json", delete=False)
-    out_file.close()
-
-    try:
-        _run(
-            [USERSIM, "run",
-             "--config", str(dp_dir / "usersim.yaml"),
-             "--out", out_file.name],
-            cwd=str(dp_dir),
-        )
-
-        try:
-            with open(out_file.name) as f:
-                data = json.load(f)
-        except Exception:
-            return {
-                "vh_total_constraint_evals": 0,
-                "vh_total_violations": 0,
-                "vh_unique_constraints": 0,
-                "vh_violated_constraints": 0,
-                "vh_antecedent_fired_count": 0,
-            }
-
-        # Walk every persona × path result and count constraint outcomes
-        # Results are flat: one dict per persona×path combination
-        total_evals = 0
-        total_violations = 0
-        antecedent_fired = 0
-        all_constraints = set()
-        violated_constraints = set()
-
-        for row in data.get("results", []):
-            for c in row.get("constraints", []):
-                label = c.get("label", "")
-                all_constraints.add(label)
-                total_evals += 1
-                if c.get("antecedent_fired", True):
-                    antecedent_fired += 1
-                if not c.get("passed", True):
-                    total_violations += 1
-                    violated_constraints.add(label)
 
+    Shares its pipeline run with data_processor_example.
+    """
+    _, data, _ = _run_data_processor()
+    if data is None:
         return {
-            "vh_total_constraint_evals": total_evals,
-            "vh_total_violations": total_violations,
-            "vh_unique_constraints": len(all_constraints),
-            "vh_violated_constraints": len(violated_constraints),
-            "vh_antecedent_fired_count": antecedent_fired,
+            "vh_total_constraint_evals": 0,
+            "vh_total_violations": 0,
+            "vh_unique_constraints": 0,
+            "vh_violated_constraints": 0,
+            "vh_antecedent_fired_count": 0,
         }
-    finally:
-        try:
-            os.unlink(out_file.name)
-        except OSError:
-            pass
+
+    # Walk every persona × path result and count constraint outcomes
+    # Results are flat: one dict per persona×path combination
+    total_evals = 0
+    total_violations = 0
+    antecedent_fired = 0
+    all_constraints = set()
+    violated_constraints = set()
+
+    add_constraint, add_violated = all_constraints.add, violated_constraints.add
+
+    for row in data.get("results", []):
+        for c in row.get("constraints", []):
+            get = c.get
+            label = get("label", "")
+            add_constraint(label)
+            total_evals += 1
+            if get("antecedent_fired", True):
+                antecedent_fired += 1
+            if not get("passed", True):
+                total_violations += 1
+                add_violated(label)
+
+    return {
+        "vh_total_constraint_evals": total_evals,
+        "vh_total_violations": total_violations,
+        "vh_unique_constraints": len(all_constraints),
+        "vh_violated_constraints": len(violated_constraints),
+        "vh_antecedent_fired_count": antecedent_fired,
+    }
 
 
 # ── Scenario: broken_example ──────────────────────────────────────────────────
 
-def measure_broken_example():
+def measure_broken_example(tmp=None):
     """
     Run usersim with an intentionally broken instrumentation script that exits
     non-zero and emits no valid JSON.  Measures that usersim detects and
@@ -478,7 +598,7 @@ def measure_broken_example():
     """
     import textwrap
 
-    with tempfile.TemporaryDirectory() as tmpdir:
+    with _scenario_dir(tmp, "broken", "tmp") as tmpdir:
         tmpdir = Path(tmpdir)
 
         # Write a deliberately broken instrumentation script
@@ -515,7 +635,7 @@ def measure_broken_example():
         # Config pointing at the broken script
         config = tmpdir / "broken.yaml"
         config.write_text(textwrap.dedent(f"""\
-            instrumentation: "python3 {broken_script}"
+            instrumentation: "{sys.executable} {broken_script}"
             paths:
               - broken
             users:
@@ -533,8 +653,8 @@ def measure_broken_example():
         ran_ok = False
         caught_failure = False
         try:
-            with open(out_path) as f:
-                out = json.load(f)
+            with open(out_path, "rb") as f:
+                out = _loads(f.read())
             ran_ok = True
             # usersim should report a non-zero exit in summary or an error field
             summary = out.get("summary", {})
@@ -577,8 +697,13 @@ if __name__ == "__main__":
     metrics = fn()
     print(f"[instrumentation] collected {len(metrics)} metrics", file=sys.stderr)
 
-    json.dump({
+    # Serialize once and hand the bytes straight to fd 1 — no text layer in
+    # between, and a single write when the payload fits in the pipe buffer.
+    payload = memoryview(_dumpb({
         "schema": "usersim.metrics.v1",
         "path": SCENARIO,
         "metrics": metrics,
-    }, sys.stdout)
+    }))
+    sys.stdout.flush()
+    while payload:
+        payload = payload[os.write(sys.stdout.fileno(), payload):]
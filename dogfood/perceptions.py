@@ -14,78 +14,78 @@ Default strategy:
 from usersim.perceptions.library import run_perceptions
 
 
-def compute(metrics: dict, **_) -> dict:
-    def num(key, default=0.0):
-        v = metrics.get(key)
-        if v is None:
-            return default
-        return float(v)
+# (fact, metric key, default when the metric is missing, cast)
+_FIELDS = (
+    # ── Pipeline execution (data_processor_example) ──────────────────
+    ("pipeline_exit_code",       "exit_code",                 -1,    float),
+    ("pipeline_wall_clock_ms",   "wall_clock_ms",             0,     float),
+    ("results_total",            "results_total",             0,     float),
+    ("results_satisfied",        "results_satisfied",         0,     float),
+    # results_score intentionally omitted — Z3 computes pass-rate
+    # relationships from results_satisfied and results_total directly
+    ("person_count",             "person_count",              0,     float),
+    ("scenario_count",           "scenario_count",            0,     float),
+    ("output_is_valid_json",     "stdout_valid_json",         False, bool),
+    ("schema_is_correct",        "results_schema_valid",      False, bool),
+    ("all_constraints_present",  "all_constraints_present",   False, bool),
 
-    def flag(key, default=False):
-        return bool(metrics.get(key, default))
+    # ── Scaffold (scaffold_and_validate) ─────────────────────────────
+    ("init_exit_code",           "init_exit_code",            -1,    float),
+    ("scaffold_file_count",      "scaffold_file_count",       0,     float),
+    ("config_created",           "config_created",            False, bool),
+    ("instrumentation_created",  "instrumentation_created",   False, bool),
+    ("perceptions_created",      "perceptions_created",       False, bool),
+    ("user_file_created",        "user_file_created",         False, bool),
+    ("yaml_parseable",           "yaml_parseable",            False, bool),
 
-    return {
-        # ── Pipeline execution (data_processor_example) ──────────────────
-        "pipeline_exit_code":       num("exit_code", -1),
-        "pipeline_wall_clock_ms":   num("wall_clock_ms", 0),
-        "results_total":            num("results_total", 0),
-        "results_satisfied":        num("results_satisfied", 0),
-        # results_score intentionally omitted — Z3 computes pass-rate
-        # relationships from results_satisfied and results_total directly
-        "person_count":             num("person_count", 0),
-        "scenario_count":           num("scenario_count", 0),
-        "output_is_valid_json":     flag("stdout_valid_json"),
-        "schema_is_correct":        flag("results_schema_valid"),
-        "all_constraints_present":  flag("all_constraints_present"),
+    # ── Error handling (bad_config) ──────────────────────────────────
+    ("missing_config_exit_code", "missing_config_exit_code",  -1,    float),
+    ("bad_yaml_exit_code",       "bad_yaml_exit_code",        -1,    float),
+    ("missing_users_exit_code",  "missing_users_exit_code",   -1,    float),
+    ("errors_use_stderr",        "error_has_stderr",          False, bool),
+    ("errors_are_clean",         "error_not_traceback",       False, bool),
+    ("errors_not_on_stdout",     "error_not_on_stdout",       False, bool),
 
-        # ── Scaffold (scaffold_and_validate) ─────────────────────────────
-        "init_exit_code":           num("init_exit_code", -1),
-        "scaffold_file_count":      num("scaffold_file_count", 0),
-        "config_created":           flag("config_created"),
-        "instrumentation_created":  flag("instrumentation_created"),
-        "perceptions_created":      flag("perceptions_created"),
-        "user_file_created":        flag("user_file_created"),
-        "yaml_parseable":           flag("yaml_parseable"),
+    # ── Judge standalone (judge_standalone) ──────────────────────────
+    ("judge_exit_code",          "judge_exit_code",           -1,    float),
+    ("judge_output_valid",       "judge_output_valid_json",   False, bool),
+    ("judge_has_results",        "judge_has_results",         False, bool),
+    ("judge_schema_correct",     "judge_schema_correct",      False, bool),
+    ("judge_satisfied_count",    "judge_satisfied_count",     0,     float),
+    ("judge_total_count",        "judge_total_count",         0,     float),
 
-        # ── Error handling (bad_config) ──────────────────────────────────
-        "missing_config_exit_code": num("missing_config_exit_code", -1),
-        "bad_yaml_exit_code":       num("bad_yaml_exit_code", -1),
-        "missing_users_exit_code":  num("missing_users_exit_code", -1),
-        "errors_use_stderr":        flag("error_has_stderr"),
-        "errors_are_clean":         flag("error_not_traceback"),
-        "errors_not_on_stdout":     flag("error_not_on_stdout"),
+    # ── Report (report_generation) ───────────────────────────────────
+    ("report_exit_code",         "report_exit_code",          -1,    float),
+    ("report_file_created",      "report_file_created",       False, bool),
+    ("report_file_size_bytes",   "report_file_size_bytes",    0,     float),
+    ("report_has_doctype",       "report_has_doctype",        False, bool),
+    ("report_has_cards",         "report_has_cards",          False, bool),
+    ("report_is_self_contained", "report_is_self_contained",  False, bool),
 
-        # ── Judge standalone (judge_standalone) ──────────────────────────
-        "judge_exit_code":          num("judge_exit_code", -1),
-        "judge_output_valid":       flag("judge_output_valid_json"),
-        "judge_has_results":        flag("judge_has_results"),
-        "judge_schema_correct":     flag("judge_schema_correct"),
-        "judge_satisfied_count":    num("judge_satisfied_count", 0),
-        "judge_total_count":        num("judge_total_count", 0),
+    # ── Violation health (violation_health) ──────────────────────────
+    # Measures usersim's own constraint churn — are constraints doing work?
+    ("vh_total_evals",           "vh_total_constraint_evals", -1,    float),
+    ("vh_total_violations",      "vh_total_violations",       -1,    float),
+    ("vh_unique_constraints",    "vh_unique_constraints",     -1,    float),
+    ("vh_violated_constraints",  "vh_violated_constraints",   -1,    float),
+    ("vh_antecedent_fired",      "vh_antecedent_fired_count", -1,    float),
 
-        # ── Report (report_generation) ───────────────────────────────────
-        "report_exit_code":         num("report_exit_code", -1),
-        "report_file_created":      flag("report_file_created"),
-        "report_file_size_bytes":   num("report_file_size_bytes", 0),
-        "report_has_doctype":       flag("report_has_doctype"),
-        "report_has_cards":         flag("report_has_cards"),
-        "report_is_self_contained": flag("report_is_self_contained"),
+    # ── Broken example (broken_example) ──────────────────────────────
+    # Verifies usersim surfaces instrumentation failures rather than
+    # silently producing empty or incorrect results.
+    ("broken_exit_code",         "broken_instr_exit_code",    -1,    float),
+    ("broken_ran_to_completion", "broken_ran_to_completion",  False, bool),
+    ("broken_failure_detected",  "broken_failure_detected",   False, bool),
+)
 
-        # ── Violation health (violation_health) ──────────────────────────
-        # Measures usersim's own constraint churn — are constraints doing work?
-        "vh_total_evals":           num("vh_total_constraint_evals", -1),
-        "vh_total_violations":      num("vh_total_violations", -1),
-        "vh_unique_constraints":    num("vh_unique_constraints", -1),
-        "vh_violated_constraints":  num("vh_violated_constraints", -1),
-        "vh_antecedent_fired":      num("vh_antecedent_fired_count", -1),
 
-        # ── Broken example (broken_example) ──────────────────────────────
-        # Verifies usersim surfaces instrumentation failures rather than
-        # silently producing empty or incorrect results.
-        "broken_exit_code":         num("broken_instr_exit_code", -1),
-        "broken_ran_to_completion": flag("broken_ran_to_completion"),
-        "broken_failure_detected":  flag("broken_failure_detected"),
-    }
+def compute(metrics: dict, **_) -> dict:
+    get = metrics.get
+    facts = {}
+    for fact, key, default, cast in _FIELDS:
+        v = get(key)
+        facts[fact] = default if v is None else cast(v)
+    return facts
 
 
 if __name__ == "__main__":
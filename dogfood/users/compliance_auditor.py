@@ -1,6 +1,8 @@
 """Compliance auditor needing reproducible evidence that all constraints were checked."""
 import sys, os
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+_root = os.path.dirname(os.path.dirname(__file__))
+if _root not in sys.path:
+    sys.path.insert(0, _root)
 
 from usersim import Person
 from usersim.judgement.z3_compat import Implies, And, Not, named
@@ -1,6 +1,8 @@
 """DevEx engineer caring about CLI ergonomics, onboarding friction, time-to-first-run."""
 import sys, os
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+_root = os.path.dirname(os.path.dirname(__file__))
+if _root not in sys.path:
+    sys.path.insert(0, _root)
 
 from usersim import Person
 from usersim.judgement.z3_compat import Implies, And, Not, named
@@ -1,9 +1,11 @@
 """Developer using usersim programmatically — subcommands and schemas must be reliable."""
 import sys, os
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+_root = os.path.dirname(os.path.dirname(__file__))
+if _root not in sys.path:
+    sys.path.insert(0, _root)
 
 from usersim import Person
-from usersim.judgement.z3_compat import Implies, And, Not, named
+from usersim.judgement.z3_compat import Implies, And, Not, PbEq, named
 from constraint_library import (
     scaffold_invariants,
     judge_invariants,
@@ -34,8 +36,8 @@ class LibraryConsumer(Person):
             # All four scaffold files must be present — no missing pieces
             named("library/all-scaffold-files-present",
                   Implies(P.init_exit_code == 0,
-                          P.config_created + P.instrumentation_created
-                          + P.perceptions_created + P.user_file_created == 4)),
+                          PbEq([(P.config_created, 1), (P.instrumentation_created, 1),
+                                (P.perceptions_created, 1), (P.user_file_created, 1)], 4))),
             # Judge satisfied count must be the full set for a well-formed test run
             named("library/judge-full-pass",
                   Implies(And(P.judge_exit_code == 0, P.judge_total_count >= 1),
@@ -1,6 +1,8 @@
 """OSS contributor adding personas/groups — needs clean extension points and good errors."""
 import sys, os
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+_root = os.path.dirname(os.path.dirname(__file__))
+if _root not in sys.path:
+    sys.path.insert(0, _root)
 
 from usersim import Person
 from usersim.judgement.z3_compat import Implies, And, Not, named
@@ -20,6 +22,8 @@ class OSSContributor(Person):
     pronoun = "they"
 
     def constraints(self, P):
+        config_fails = P.missing_config_exit_code == 1
+
         return [
             *matrix_invariants(P),
             *pipeline_invariants(P),
@@ -36,9 +40,9 @@ class OSSContributor(Person):
                   Implies(P.pipeline_exit_code == 0, P.all_constraints_present)),
             # Error messages must be clean (contributor sees them most)
             named("oss/error-messages-are-clean",
-                  Implies(P.missing_config_exit_code == 1, P.errors_are_clean)),
+                  Implies(config_fails, P.errors_are_clean)),
             named("oss/errors-go-to-stderr",
-                  Implies(P.missing_config_exit_code == 1, P.errors_use_stderr)),
+                  Implies(config_fails, P.errors_use_stderr)),
             # Adding a persona must not break existing result count
             named("oss/result-count-consistent-with-persons",
                   Implies(P.results_total >= 1,
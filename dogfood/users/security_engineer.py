@@ -1,6 +1,8 @@
 """Security engineer verifying constraint coverage on denial and boundary conditions."""
 import sys, os
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+_root = os.path.dirname(os.path.dirname(__file__))
+if _root not in sys.path:
+    sys.path.insert(0, _root)
 
 from usersim import Person
 from usersim.judgement.z3_compat import Implies, And, Not, named
@@ -18,6 +20,12 @@ class SecurityEngineer(Person):
     pronoun = "she"
 
     def constraints(self, P):
+        # Every error scenario was observed (codes default to -1 when skipped)
+        errors_measured = And(P.missing_config_exit_code >= 0,
+                              P.bad_yaml_exit_code >= 0,
+                              P.missing_users_exit_code >= 0)
+        config_fails = P.missing_config_exit_code == 1
+
         return [
             *matrix_invariants(P),
             *pipeline_invariants(P),
@@ -36,15 +44,13 @@ class SecurityEngineer(Person):
                           P.missing_users_exit_code > 0)),
             # Errors must go to stderr — never stdout
             named("sec/errors-not-on-stdout",
-                  Implies(P.missing_config_exit_code == 1, P.errors_not_on_stdout)),
+                  Implies(config_fails, P.errors_not_on_stdout)),
             # Error messages must be clean — no stack traces or internal paths
             named("sec/errors-are-clean",
-                  Implies(P.missing_config_exit_code == 1, P.errors_are_clean)),
+                  Implies(config_fails, P.errors_are_clean)),
             # Three denial paths sum to exactly 3 — no unexpected exit codes
             named("sec/denial-exit-codes-sum-to-3",
-                  Implies(And(P.missing_config_exit_code >= 0,
-                              P.bad_yaml_exit_code >= 0,
-                              P.missing_users_exit_code >= 0),
+                  Implies(errors_measured,
                           (P.missing_config_exit_code
                            + P.bad_yaml_exit_code
                            + P.missing_users_exit_code) == 3)),
@@ -0,0 +1,145 @@
+"""
+Unit tests for the dogfood constraint library (dogfood/constraint_library.py).
+"""
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from usersim.judgement.engine import _make_fact_vars
+from usersim.judgement.person import FactNamespace
+from usersim.judgement.z3_compat import Z3_REAL
+
+DOGFOOD_DIR = Path(__file__).parent.parent / "dogfood"
+
+
+def _load_dogfood(stem):
+    """Import dogfood/<stem>.py by path, without adding dogfood/ to sys.path."""
+    spec = importlib.util.spec_from_file_location(stem, DOGFOOD_DIR / f"{stem}.py")
+    mod  = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+cl      = _load_dogfood("constraint_library")
+compute = _load_dogfood("perceptions").compute
+
+
+def _namespace(metrics=None):
+    fact_vars = _make_fact_vars(compute(metrics or {}))
+    fact_vars.pop("_assignments")
+    return FactNamespace(fact_vars)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    cl.clear_constraint_cache()
+    yield
+    cl.clear_constraint_cache()
+
+
+class TestMemoization:
+    def test_same_namespace_hits_cache(self):
+        P = _namespace()
+        assert cl.matrix_invariants(P) is cl.matrix_invariants(P)
+
+    def test_distinct_namespaces_do_not_share(self):
+        assert cl.matrix_invariants(_namespace()) is not cl.matrix_invariants(_namespace())
+
+    def test_timing_args_are_part_of_key(self):
+        P = _namespace()
+        a = cl.timing_invariants(P, max_ms_per_result=3000, max_total_ms=60000)
+        b = cl.timing_invariants(P, max_ms_per_result=4000, max_total_ms=90000)
+        assert a is not b
+
+    def test_clear_constraint_cache(self):
+        P = _namespace()
+        first = cl.report_invariants(P)
+        cl.clear_constraint_cache()
+        assert cl.report_invariants(P) is not first
+
+
+class TestFlatMode:
+    def test_flat_collapses_group_into_one_named_check(self):
+        (check,) = cl.judge_invariants(_namespace(), flat=True)
+        assert check._repr == "judge"
+
+    def test_flat_is_cached_separately(self):
+        P = _namespace()
+        assert len(cl.judge_invariants(P)) > 1
+        assert len(cl.judge_invariants(P, flat=True)) == 1
+
+
+class TestSubGroups:
+    @pytest.mark.parametrize("group, parts", [
+        (cl.report_invariants, (cl.report_structural_invariants,
+                                cl.report_size_invariants,
+                                cl.report_coherence_invariants)),
+        (cl.error_handling_invariants, (cl.exit_code_invariants,
+                                        cl.stderr_invariants,
+                                        cl.clean_message_invariants)),
+    ])
+    def test_group_is_concatenation_of_parts(self, group, parts):
+        P = _namespace()
+        assert group(P) == tuple(c for part in parts for c in part(P))
+
+
+class TestCheckNames:
+    @pytest.mark.parametrize("group", [
+        cl.matrix_invariants, cl.pipeline_invariants, cl.timing_invariants,
+        cl.error_handling_invariants, cl.report_invariants,
+        cl.scaffold_invariants, cl.judge_invariants,
+        cl.exit_code_invariants, cl.stderr_invariants, cl.clean_message_invariants,
+        cl.report_structural_invariants, cl.report_size_invariants,
+        cl.report_coherence_invariants,
+    ])
+    def test_names_match_built_labels(self, group):
+        assert cl.check_names(group) == tuple(c._repr for c in group(_namespace()))
+
+    def test_not_on_stdout_covers_original_two_modes(self):
+        names = cl.check_names(cl.error_handling_invariants)
+        assert len(names) == 13
+        assert names[-2:] == ("errors/missing-config-not-on-stdout",
+                              "errors/bad-yaml-not-on-stdout")
+
+    def test_pipeline_checks_keep_report_order(self):
+        assert cl.check_names(cl.pipeline_invariants) == (
+            "pipeline/exit-0-implies-results-exist",
+            "pipeline/exit-0-implies-valid-json",
+            "pipeline/exit-0-implies-correct-schema",
+            "pipeline/valid-json-and-schema-implies-results",
+            "pipeline/valid-json-implies-satisfied-lte-total",
+            "pipeline/exit-0-implies-constraints-present",
+        )
+
+    def test_all_check_names_are_interned_and_unique(self):
+        names = cl.all_check_names()
+        assert len(set(names)) == len(names)
+        built = {c._repr for c in cl.pipeline_invariants(_namespace())}
+        assert all(any(n is b for n in names) for b in built)
+
+    def test_names_do_not_import_z3(self):
+        code = (
+            "import sys; sys.path.insert(0, %r)\n"
+            "import constraint_library as cl\n"
+            "assert cl.check_names(cl.report_invariants)\n"
+            "assert 'usersim.judgement.z3_compat' not in sys.modules\n"
+        ) % str(DOGFOOD_DIR)
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.mark.skipif(not Z3_REAL, reason="simplification needs real Z3")
+class TestPrebuildSimplify:
+    def test_labels_and_antecedents_survive(self):
+        P = _namespace()
+        plain = cl.report_invariants(P)
+        cl.enable_prebuild_simplify()
+        try:
+            simplified = cl.report_invariants(P)
+        finally:
+            cl.enable_prebuild_simplify(False)
+        assert [c._repr for c in simplified] == [c._repr for c in plain]
+        assert [hasattr(c, "_antecedent") for c in simplified] == \
+               [hasattr(c, "_antecedent") for c in plain]
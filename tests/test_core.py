@@ -7,9 +7,9 @@ from pathlib import Path
 
 import pytest
 
-from usersim.judgement.engine  import evaluate_person, _make_fact_vars
+from usersim.judgement.engine  import evaluate_person, _make_fact_vars, _prepare_facts
 from usersim.judgement.person  import Person, FactNamespace
-from usersim.judgement.z3_compat import BoolVal, RealVal, And, Or, Not, Implies, Solver, sat, unsat
+from usersim.judgement.z3_compat import BoolVal, RealVal, And, Or, Not, Implies, Guard, PbEq, PbGe, Solver, sat, unsat, named, formula_text
 from usersim.perceptions.library  import threshold, in_range, ratio, flag
 from usersim.schema               import validate_metrics, validate_perceptions
 
@@ -48,6 +48,17 @@ class TestZ3Compat:
         # False => X is vacuously true
         s = Solver(); s.add(Implies(BoolVal(False), BoolVal(False))); assert s.check() == sat
 
+    def test_guard_matches_implies(self):
+        for a in (True, False):
+            for b in (True, False):
+                s = Solver(); s.add(Guard(BoolVal(a), BoolVal(b)))
+                assert (s.check() == sat) == ((not a) or b)
+
+    def test_guard_keeps_antecedent(self):
+        g = Guard(BoolVal(True), BoolVal(False))
+        assert g._antecedent is not None
+        assert g._repr.startswith("If ")
+
     def test_real_comparison(self):
         val = RealVal(0.8)
         # val >= 0.5 should be True
@@ -60,6 +71,41 @@ class TestZ3Compat:
         s.add(BoolVal(True))
         assert s.check() == sat
 
+    def test_pb_eq(self):
+        flags = [(BoolVal(True), 1), (BoolVal(True), 1), (BoolVal(False), 1)]
+        s = Solver(); s.add(PbEq(flags, 2)); assert s.check() == sat
+        s = Solver(); s.add(PbEq(flags, 3)); assert s.check() == unsat
+
+    def test_pb_ge(self):
+        flags = [(BoolVal(True), 1), (BoolVal(False), 1)]
+        s = Solver(); s.add(PbGe(flags, 1)); assert s.check() == sat
+        s = Solver(); s.add(PbGe(flags, 2)); assert s.check() == unsat
+
+    def test_named_leaves_its_argument_unlabelled(self):
+        check = Implies(BoolVal(True), BoolVal(True))
+        labelled = named("x", check)
+        assert labelled._repr == "x" and labelled._antecedent is check._antecedent
+        assert check._repr.startswith("If ")
+
+    def test_formula_text_matches_str(self):
+        expr = RealVal(2) >= RealVal(1)
+        assert formula_text(expr) == str(expr)
+        assert formula_text(RealVal(2) >= RealVal(1)) == str(expr)
+        assert formula_text(True) == "True"
+
+    def test_named_keeps_implies_repr_as_formula(self):
+        c = named("c", Implies(BoolVal(True), BoolVal(False)))
+        assert c._repr == "c" and c._expr_repr.startswith("If ")
+
+    def test_push_pop(self):
+        s = Solver()
+        s.add(BoolVal(True))
+        s.push()
+        s.add(BoolVal(False))
+        assert s.check() == unsat
+        s.pop()
+        assert s.check() == sat
+
 
 # ── FactNamespace ─────────────────────────────────────────────────────────────
 
@@ -73,6 +119,11 @@ class TestFactNamespace:
         with pytest.raises(AttributeError, match="bar"):
             _ = ns.bar
 
+    def test_fact_is_a_plain_attribute(self):
+        foo = BoolVal(True)
+        ns = FactNamespace({"foo": foo})
+        assert vars(ns)["foo"] is foo and ns.foo is foo
+
     def test_repr(self):
         ns = FactNamespace({"a": BoolVal(True), "b": BoolVal(False)})
         assert "a" in repr(ns) and "b" in repr(ns)
@@ -147,6 +198,45 @@ class TestEvaluatePerson:
         r = evaluate_person(p, {"is_large": False, "has_clusters": False})
         assert r["satisfied"] is True
 
+    def test_prepared_namespace_is_shared(self):
+        seen = []
+        p = self._person(lambda P: seen.append(P) or [P.is_fast])
+        prepared = _prepare_facts({"is_fast": True})
+        r1 = evaluate_person(p, prepared=prepared)
+        r2 = evaluate_person(p, prepared=prepared)
+        assert r1["satisfied"] and r2["satisfied"]
+        assert seen[0] is seen[1]
+
+    def test_label_does_not_leak_into_next_person(self):
+        prepared = _prepare_facts({"is_fast": True, "ms": 50.0})
+        a = self._person(lambda P: [named("a/fast", P.is_fast), P.ms < 100])
+        b = self._person(lambda P: [P.is_fast, P.ms < 100])
+        evaluate_person(a, prepared=prepared)
+        labels = [c["label"] for c in evaluate_person(b, prepared=prepared)["constraints"]]
+        assert labels[0] == "True"
+
+    def test_failed_check_does_not_leak_into_next_person(self):
+        prepared = _prepare_facts({"is_fast": True, "ms": 50.0})
+        bad  = self._person(lambda P: [P.ms > 100, P.is_fast])
+        good = self._person(lambda P: [P.ms < 100, P.is_fast])
+        assert evaluate_person(bad, prepared=prepared)["score"] == 0.5
+        assert evaluate_person(good, prepared=prepared)["satisfied"] is True
+
+    def test_shared_check_is_solved_once_per_path(self):
+        prepared = _prepare_facts({"is_fast": True})
+        p = self._person(lambda P: [P.is_fast])
+        assert evaluate_person(p, prepared=prepared)["satisfied"]
+        assert evaluate_person(p, prepared=prepared)["satisfied"]
+        assert len(prepared[2]) == 1
+
+    def test_facts_with_prepared_is_rejected(self):
+        p = self._person(lambda P: [P.is_fast])
+        prepared = _prepare_facts({"is_fast": True})
+        with pytest.raises(ValueError):
+            evaluate_person(p, {"is_fast": False}, prepared=prepared)
+        with pytest.raises(TypeError):
+            evaluate_person(p, {}, prepared)
+
     def test_missing_fact_returns_error(self):
         p = self._person(lambda P: [P.nonexistent_fact])
         r = evaluate_person(p, {})
@@ -13,6 +13,7 @@ The perceptions input can be supplied as:
 from __future__ import annotations
 
 import json
+import math
 import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -69,10 +70,77 @@ def _named_real_var(name: str, value: float):
     return Real(name)
 
 
-def evaluate_person(person: "Person", facts: dict) -> dict:
+def _prepare_facts(facts: dict) -> tuple:
+    """
+    Build the (FactNamespace, base solver, verdicts) triple for one
+    perceptions dict.
+
+    The base solver holds the fact assignments (real Z3 only); constraints
+    are checked in push/pop frames on top of it, so the assignments are
+    asserted once rather than once per check.  `verdicts` caches each
+    check's result against that base (see _check_cached).
+
+    Every person judged against the same facts can share the result: the
+    namespace is read-only (named() labels a fresh reference, not the fact
+    or check it is given), sharing it lets constraint helpers that memoize
+    per namespace build their expressions once for all persons, and every
+    check pops back to the base level.
+    """
+    fact_vars   = _make_fact_vars(facts)
+    assignments = fact_vars.pop("_assignments", {})
+
+    solver = Solver()
+    if Z3_REAL and assignments:
+        for var_name, val in assignments.items():
+            v = math.copysign(1e9, val) if (math.isinf(val) or math.isnan(val)) else val
+            solver.add(Real(var_name) == v)
+    return FactNamespace(fact_vars), solver, {}
+
+
+def _check_in_frame(solver, expr) -> bool:
+    """Return whether expr is satisfiable on top of solver's assertions."""
+    solver.push()
+    try:
+        solver.add(expr)
+        return solver.check() == sat
+    finally:
+        solver.pop()
+
+
+def _check_cached(solver, verdicts: dict, expr) -> bool:
+    """
+    _check_in_frame, solved once per distinct expression on one base solver.
+
+    Persons judged on the same facts share memoized constraint groups, and
+    many checks share an antecedent, so the same term comes up repeatedly
+    against the same assignments.  Keys are Z3 AST ids (equal terms share
+    one) or, in the shim, object ids; each entry holds its expression so
+    the key cannot be recycled while cached.
+    """
+    try:
+        key = expr.get_id() if Z3_REAL else id(expr)
+    except AttributeError:
+        return _check_in_frame(solver, expr)
+    hit = verdicts.get(key)
+    if hit is not None and (hit[0] is expr or Z3_REAL and hit[0].eq(expr)):
+        return hit[1]
+    ok = _check_in_frame(solver, expr)
+    verdicts[key] = (expr, ok)
+    return ok
+
+
+def evaluate_person(
+    person: "Person", facts: dict | None = None, *, prepared: tuple | None = None
+) -> dict:
     """
     Run Z3 constraint check for one person against one perceptions dict.
 
+    Pass either `facts`, prepared for this call alone, or `prepared=`, a
+    _prepare_facts(facts) result shared across persons judged on the same
+    facts.  The prepared triple already carries the facts, so passing a
+    non-empty `facts` alongside it raises ValueError rather than ignoring
+    one of the two.
+
     Returns:
         {
             "person":     str,
@@ -81,8 +149,11 @@ def evaluate_person(person: "Person", facts: dict) -> dict:
             "violations": [str],
         }
     """
-    fact_vars = _make_fact_vars(facts)
-    namespace = FactNamespace(fact_vars)
+    if prepared is None:
+        prepared = _prepare_facts(facts or {})
+    elif facts:
+        raise ValueError("evaluate_person: pass facts or prepared=, not both.")
+    namespace, solver, verdicts = prepared
 
     try:
         constraints = person.constraints(namespace)
@@ -108,39 +179,21 @@ def evaluate_person(person: "Person", facts: dict) -> dict:
             "violations":  [],
         }
 
-    # When using real Z3, inject variable assignments so symbolic constraints
-    # evaluate correctly (Real("x") == 1.0 added per variable).
-    assignments = fact_vars.pop("_assignments", {})
-
     passed           = 0
     violations       = []
     all_labels       = []
     constraint_results = []   # [{"label": str, "passed": bool, "antecedent_fired": bool|None}]
 
-    import math as _math
-
-    def _make_solver():
-        s = Solver()
-        if Z3_REAL and assignments:
-            for var_name, val in assignments.items():
-                v = _math.copysign(1e9, val) if (_math.isinf(val) or _math.isnan(val)) else val
-                s.add(Real(var_name) == v)
-        return s
-
     for i, c in enumerate(constraints):
         label = getattr(c, "_repr", None) or repr(c) or f"constraint[{i}]"
         all_labels.append(label)
 
-        solver = _make_solver()
-        solver.add(c)
-        ok = solver.check() == sat
+        ok = _check_cached(solver, verdicts, c)
 
         # For Implies constraints, check whether the antecedent ever fires
         antecedent = getattr(c, "_antecedent", None)
         if antecedent is not None:
-            ant_solver = _make_solver()
-            ant_solver.add(antecedent)
-            antecedent_fired = ant_solver.check() == sat
+            antecedent_fired = _check_cached(solver, verdicts, antecedent)
         else:
             antecedent_fired = None
 
@@ -200,11 +253,12 @@ def _evaluate(perceptions_doc: dict, user_files: list) -> dict:
     if person_name == "all":
         person_name = None
 
-    persons = _load_persons(user_files, target_name=person_name)
+    persons  = _load_persons(user_files, target_name=person_name)
+    prepared = _prepare_facts(facts)
 
     person_results = []
     for person in persons:
-        result = evaluate_person(person, facts)
+        result = evaluate_person(person, prepared=prepared)
         result["path"] = path
         person_results.append(result)
 
@@ -265,8 +319,9 @@ def run_matrix(
         facts    = doc.get("facts", {})
         path = doc.get("path", pf.stem)
         persons  = _load_persons(user_files)
+        prepared = _prepare_facts(facts)
         for person in persons:
-            r = evaluate_person(person, facts)
+            r = evaluate_person(person, prepared=prepared)
             r["path"] = path
             all_results.append(r)
 
@@ -27,8 +27,12 @@ class FactNamespace:
     """
     Wraps a dict of {name → Z3_Bool} so person files can write
     `P.understands_structure` instead of `facts["understands_structure"]`.
+
+    Facts are copied into the instance __dict__ so `P.x` is an ordinary
+    attribute hit; __getattr__ only runs for unknown names, to explain them.
     """
     def __init__(self, fact_vars: dict):
+        vars(self).update(fact_vars)
         self._vars = fact_vars
 
     def __getattr__(self, name: str):
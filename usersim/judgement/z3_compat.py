@@ -9,12 +9,15 @@ handles the Boolean / numeric constraint patterns usersim uses.
 The shim is NOT a general-purpose SMT solver.  It supports:
   - Bool / BoolVal
   - Int / RealVal
-  - And / Or / Not / Implies
+  - And / Or / Not / Implies / Guard
+  - named / formula_text
+  - PbEq / PbGe over (Bool, weight) pairs
   - ArithRef comparisons (==, !=, <, <=, >, >=)
-  - Solver.add / Solver.check / Solver.model
+  - Solver.add / Solver.push / Solver.pop / Solver.check / Solver.model
   - sat / unsat constants
 """
 
+import copy
 import sys
 
 try:
@@ -28,22 +31,80 @@ try:
     )
     import z3 as _z3_mod
 
+    # Z3's pretty-printer is the slowest step in labelling a check, and the
+    # same terms recur across checks and paths (Z3 hash-conses structurally
+    # equal terms into one AST, with one id).  Rendered text is cached per id;
+    # each entry keeps its expression alive so the id cannot be reused.
+    _texts = {}
+    _TEXT_CACHE_SIZE = 4096
+
+    def formula_text(expr):
+        """str(expr), rendered by Z3's printer once per distinct term."""
+        try:
+            key = expr.get_id()
+        except AttributeError:
+            return str(expr)
+        hit = _texts.get(key)
+        if hit is not None and hit[0].eq(expr):
+            return hit[1]
+        if len(_texts) >= _TEXT_CACHE_SIZE:
+            _texts.clear()
+        text = str(expr)
+        _texts[key] = (expr, text)
+        return text
+
     def Implies(a, b):
         """Wrap z3.Implies and attach a human-readable _repr and antecedent."""
         expr = _z3_mod.Implies(a, b)
-        expr._repr = f"If {a}, then {b}"
+        expr._repr = f"If {formula_text(a)}, then {formula_text(b)}"
         expr._antecedent = a
         return expr
 
+    def Guard(flag, body):
+        """Implies(flag, body) for a Bool guard, emitted as Or(Not(flag), body).
+
+        Skips Z3's implication rewrite; keeps the same _repr and _antecedent
+        as Implies so reports and vacuity checks are unaffected.
+        """
+        expr = _z3_mod.Or(_z3_mod.Not(flag), body)
+        expr._repr = f"If {formula_text(flag)}, then {formula_text(body)}"
+        expr._antecedent = flag
+        return expr
+
+    def _as_bool(term):
+        return term if _z3_mod.is_bool(term) else term == 1
+
+    def PbEq(args, k):
+        """z3.PbEq over (term, weight) pairs; numeric 0/1 terms are compared to 1."""
+        return _z3_mod.PbEq([(_as_bool(t), w) for t, w in args], k)
+
+    def PbGe(args, k):
+        """z3.PbGe over (term, weight) pairs; numeric 0/1 terms are compared to 1."""
+        return _z3_mod.PbGe([(_as_bool(t), w) for t, w in args], k)
+
     def named(label: str, expr):
         """Attach a human-readable name to any Z3 expression.
 
         Preserves the original Z3 expression repr as _expr_repr so the
-        report can show both the name and the underlying formula.
+        report can show both the name and the underlying formula.  Z3's
+        printer only runs when the expression has no _repr of its own.
+
+        The label goes on a fresh reference to the same AST, never on expr
+        itself: facts and memoized checks are shared by every person judged
+        on the same facts, so labelling them in place would leak one
+        person's names into the next person's report.
         """
-        expr._expr_repr = getattr(expr, "_repr", repr(expr))
-        expr._repr = label
-        return expr
+        labelled = type(expr)(expr.as_ast(), expr.ctx)
+        try:
+            labelled._expr_repr = expr._repr
+        except AttributeError:
+            labelled._expr_repr = formula_text(expr)
+        try:
+            labelled._antecedent = expr._antecedent
+        except AttributeError:
+            pass
+        labelled._repr = label
+        return labelled
 
     Z3_REAL = True
 
@@ -121,15 +182,32 @@ except Exception:
         expr._antecedent = a
         return expr
 
+    Guard = Implies
+
+    formula_text = str
+
+    def _pb(args, k, op, sym):
+        args = [(_lit(a), w) for a, w in args]
+        return _Expr(lambda env, _a=args: op(sum(w for a, w in _a if bool(a(env))), k),
+                     f"{sym}({', '.join(f'({a!r}, {w})' for a, w in args)}, {k})")
+
+    def PbEq(args, k):
+        return _pb(args, k, lambda a, b: a == b, "PbEq")
+
+    def PbGe(args, k):
+        return _pb(args, k, lambda a, b: a >= b, "PbGe")
+
     def named(label: str, expr):
         """Attach a human-readable name to any expression.
 
         Preserves the original expression repr as _expr_repr so the
         report can show both the name and the underlying formula.
+        Labels a copy of expr, never expr itself (see the Z3 named()).
         """
-        expr._expr_repr = getattr(expr, "_repr", repr(expr))
-        expr._repr = label
-        return expr
+        labelled = copy.copy(expr)
+        labelled._expr_repr = getattr(expr, "_repr", repr(expr))
+        labelled._repr = label
+        return labelled
 
     def If(cond, then, else_):
         cond, then, else_ = _lit(cond), _lit(then), _lit(else_)
@@ -149,8 +227,12 @@ except Exception:
             return self._env.get(str(expr))
 
     class Solver:
-        def __init__(self):   self._constraints = []
+        def __init__(self):   self._constraints = []; self._frames = []
         def add(self, *args): self._constraints.extend(args)
+        def push(self):       self._frames.append(len(self._constraints))
+        def pop(self, num=1):
+            for _ in range(num):
+                del self._constraints[self._frames.pop():]
         def check(self):
             # Evaluate with empty env (all facts already embedded in expressions)
             env = {}